@@ -40,7 +40,9 @@ DEFAULT_WEBHOOKS_CONFIG = {
             'enabled-projects': ['test/test'], 
             'remote-file': '.gitlab-robot/reviewer-suggestion.jinja',
             'file': '../resources/reviewer-suggestion.jinja',
-            'target-branches': ['main', 'master']
+            'target-branches': ['main', 'master'],
+            'changes-page-size': 100,
+            'stop-when-all-owners-found': True
         },
         "jira-issue-transition": {
             "enabled-project-keys": ["JTP", "EI", "SWC"]
@@ -24,6 +24,17 @@ class ReviewerSuggestion:
 
         self._env = Environment(loader=FileSystemLoader("."), autoescape=True)
 
+    def _changed_files(self, project, mr_iid):
+        # Stream changed paths page by page from the diffs API instead of loading
+        # all changes at once with mr.changes(), which does not scale for huge merge requests
+        diffs = self._gitlab.http_list(
+            '/projects/{0}/merge_requests/{1}/diffs'.format(project.id, mr_iid),
+            iterator=True, per_page=self._config.get('changes-page-size', 100))
+        for diff in diffs:
+            yield diff['new_path']
+            if diff['old_path'] != diff['new_path']:
+                yield diff['old_path']
+
     def _add_reviewer_suggestion(self, event):
         project_name = event['project']['path_with_namespace']
         if project_name not in self._config['enabled-projects']:
@@ -41,17 +52,7 @@ class ReviewerSuggestion:
         project = self._gitlab.projects.get(event['project']['id'])
         mr_iid = event['object_attributes']['iid']
         mr = project.mergerequests.get(mr_iid, lazy=True)
-        mr_changes = mr.changes()
-        changed_files = set()
-        if 'changes' in mr_changes.keys():
-            for change in mr_changes['changes']:
-                changed_files.add(change['old_path'])
-                changed_files.add(change['new_path'])
-        if len(changed_files) == 0:
-            self._logger.error('No changed files in merge request')
-            return
 
-        self._logger.info('Changed files: {0}'.format(changed_files))
         owners_file = None
         refs = ['master', 'main']
         try:
@@ -60,10 +61,23 @@ class ReviewerSuggestion:
             self._logger.error("CODEOWNERS file is not present in: {0}".format(', '.join(refs)))
             raise
         owners = CodeOwners(owners_file)
+        # Owners listed anywhere in CODEOWNERS, once all of them are found no further file can add new ones
+        all_owners = {v[1] for path in owners.paths for v in path[2]}
+        stop_early = self._config.get('stop-when-all-owners-found', True)
+
         change_owners = set()
-        for changed_file in changed_files:
-            self._logger.info('Owners of file {0} are {1}'.format(changed_file, owners.of(changed_file)))
-            change_owners = set.union(change_owners, {v[1] for v in owners.of(changed_file)})
+        changed_files_count = 0
+        for changed_file in self._changed_files(project, mr_iid):
+            changed_files_count += 1
+            file_owners = owners.of(changed_file)
+            self._logger.info('Owners of file {0} are {1}'.format(changed_file, file_owners))
+            change_owners.update(v[1] for v in file_owners)
+            if stop_early and change_owners >= all_owners:
+                self._logger.info('All code owners found after {0} changed files, skipping the rest'.format(changed_files_count))
+                break
+        if changed_files_count == 0:
+            self._logger.error('No changed files in merge request')
+            return
 
         author = '@{0}'.format(event['user']['username'])
         author_is_the_only_codeowner = (author in change_owners) and (len(change_owners) == 1)